@@ -0,0 +1,19 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from _pytest.tmpdir import TempPathFactory
+
+
+@pytest.fixture(autouse=True)
+def cache_home(
+    monkeypatch: Generator[MonkeyPatch, None, None], tmp_path_factory: TempPathFactory
+) -> Path:
+    # Keep the RasterDataset index cache out of the user's cache directory
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(path))  # type: ignore[attr-defined]
+    return path
@@ -50,6 +50,23 @@ class TestFAIR1M:
             shutil.copy(filepath, str(tmp_path))
         FAIR1M(root=str(tmp_path), checksum=True)
 
+    def test_already_extracted_newer(
+        self,
+        dataset: FAIR1M,
+        tmp_path: Path,
+        monkeypatch: Generator[MonkeyPatch, None, None],
+    ) -> None:
+        for filename in dataset.filenames:
+            filepath = os.path.join("tests", "data", "fair1m", filename)
+            shutil.copy(filepath, str(tmp_path))
+        directory = os.path.join(str(tmp_path), "images")
+        shutil.copytree(os.path.join("tests", "data", "fair1m", "images"), directory)
+        os.utime(directory)
+        # Only the archive without an up to date directory should be hashed
+        md5s = ["bad", "aca59017207141951b53e91795d8179e"]
+        monkeypatch.setattr(FAIR1M, "md5s", md5s)  # type: ignore[attr-defined]
+        FAIR1M(root=str(tmp_path), checksum=True)
+
     def test_corrupted(self, tmp_path: Path) -> None:
         filenames = ["images.zip", "labelXmls.zip"]
         for filename in filenames:
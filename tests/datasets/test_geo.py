@@ -3,14 +3,21 @@
 
 import os
 import pickle
+import shutil
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Generator
 
+import numpy as np
 import pytest
+import rasterio
 import torch
 import torch.nn as nn
 from _pytest.fixtures import SubRequest
+from _pytest.monkeypatch import MonkeyPatch
+from rasterio.control import GroundControlPoint
 from rasterio.crs import CRS
+from rasterio.env import get_gdal_config
+from rasterio.transform import Affine
 from torch.utils.data import ConcatDataset
 
 from torchgeo.datasets import (
@@ -182,6 +189,172 @@ class TestRasterDataset:
         with pytest.raises(FileNotFoundError, match="No RasterDataset data was found"):
             RasterDataset(str(tmp_path))
 
+    def test_gcps(self, tmp_path: Path) -> None:
+        crs = CRS.from_epsg(32618)
+        gcps = [
+            GroundControlPoint(row=0, col=0, x=500000, y=4200000),
+            GroundControlPoint(row=0, col=100, x=501000, y=4200000),
+            GroundControlPoint(row=100, col=0, x=500000, y=4199000),
+        ]
+        profile = {"driver": "GTiff", "width": 100, "height": 100, "count": 1}
+        with rasterio.open(tmp_path / "gcps.tif", "w", dtype="uint8", **profile) as f:
+            f.write(np.zeros((1, 100, 100), dtype=np.uint8))
+            f.gcps = (gcps, crs)
+        ds = RasterDataset(str(tmp_path))
+        assert ds.crs == crs
+        assert ds.res == 10
+        assert ds.bounds[:4] == [500000, 501000, 4199000, 4200000]
+
+    def test_south_up(self, tmp_path: Path) -> None:
+        crs = CRS.from_epsg(32618)
+        transform = Affine(10, 0, 500000, 0, 10, 4200000)
+        profile = {"driver": "GTiff", "width": 100, "height": 100, "count": 1}
+        with rasterio.open(
+            tmp_path / "south.tif",
+            "w",
+            crs=crs,
+            transform=transform,
+            dtype="uint8",
+            **profile,
+        ) as f:
+            f.write(np.zeros((1, 100, 100), dtype=np.uint8))
+        ds = RasterDataset(str(tmp_path))
+        assert ds.bounds[:4] == [500000, 501000, 4200000, 4201000]
+
+    def test_not_georeferenced(self, tmp_path: Path) -> None:
+        root = str(tmp_path / "naip")
+        shutil.copytree(os.path.join("tests", "data", "naip"), root)
+        filepath = os.path.join(root, "m_9999999_ne_18_060_20181104.tif")
+        profile = {"driver": "GTiff", "width": 10, "height": 10, "count": 1}
+        with rasterio.open(filepath, "w", dtype="uint8", **profile) as f:
+            f.write(np.zeros((1, 10, 10), dtype=np.uint8))
+        ds = NAIP(root)
+        assert len(ds) == 2
+        assert [path for path, _ in ds.skipped_files] == [filepath]
+        assert "CRSError" in ds.skipped_files[0][1]
+
+    def test_gdal_config(
+        self, monkeypatch: Generator[MonkeyPatch, None, None], tmp_path: Path
+    ) -> None:
+        open_ = rasterio.open
+        options = []
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            options.append(get_gdal_config("GDAL_DISABLE_READDIR_ON_OPEN"))
+            return open_(*args, **kwargs)
+
+        monkeypatch.setattr(rasterio, "open", record)  # type: ignore[attr-defined]
+        root = os.path.join("tests", "data", "naip")
+        NAIP(root)
+        assert options[-1] is True
+
+        # A value set by the user is not overridden
+        options.clear()
+        monkeypatch.setenv("TORCHGEO_INDEX_CACHE", "0")  # type: ignore[attr-defined]
+        with rasterio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+            NAIP(root)
+        assert options
+        assert set(options) == {"EMPTY_DIR"}
+
+    def test_index_cache(
+        self, monkeypatch: Generator[MonkeyPatch, None, None], tmp_path: Path
+    ) -> None:
+        root = str(tmp_path / "naip")
+        shutil.copytree(os.path.join("tests", "data", "naip"), root)
+        ds1 = NAIP(root)
+
+        def probe(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("index should be loaded from cache")
+
+        monkeypatch.setattr(NAIP, "_probe", probe)  # type: ignore[attr-defined]
+        ds2 = NAIP(root)
+        assert ds1.bounds == ds2.bounds
+        assert ds1.crs == ds2.crs
+        assert ds1.res == ds2.res
+
+        # Overwriting a file in place invalidates the cache
+        shutil.copyfile(
+            os.path.join(root, "m_3807511_ne_18_060_20190605.tif"),
+            os.path.join(root, "m_3807511_ne_18_060_20181104.tif"),
+        )
+        with pytest.raises(AssertionError, match="index should be loaded from cache"):
+            NAIP(root)
+
+    def test_index_cache_disabled(
+        self,
+        monkeypatch: Generator[MonkeyPatch, None, None],
+        cache_home: Path,
+        tmp_path: Path,
+    ) -> None:
+        monkeypatch.setenv("TORCHGEO_INDEX_CACHE", "0")  # type: ignore[attr-defined]
+        root = str(tmp_path / "naip")
+        shutil.copytree(os.path.join("tests", "data", "naip"), root)
+        NAIP(root)
+        assert not os.path.exists(os.path.join(str(cache_home), "torchgeo"))
+
+    def test_index_cache_write_error(
+        self,
+        monkeypatch: Generator[MonkeyPatch, None, None],
+        cache_home: Path,
+        tmp_path: Path,
+    ) -> None:
+        def dump(*args: Any, **kwargs: Any) -> None:
+            raise pickle.PicklingError
+
+        monkeypatch.setattr(pickle, "dump", dump)  # type: ignore[attr-defined]
+        root = str(tmp_path / "naip")
+        shutil.copytree(os.path.join("tests", "data", "naip"), root)
+        NAIP(root)
+        assert os.listdir(os.path.join(str(cache_home), "torchgeo", "index")) == []
+
+    def test_skipped_files(
+        self, monkeypatch: Generator[MonkeyPatch, None, None], tmp_path: Path
+    ) -> None:
+        root = str(tmp_path / "naip")
+        shutil.copytree(os.path.join("tests", "data", "naip"), root)
+        corrupt = os.path.join(root, "m_3807511_ne_18_060_20181104.tif")
+        with open(corrupt, "w") as f:
+            f.write("corrupt")
+        ds = NAIP(root)
+        assert [filepath for filepath, _ in ds.skipped_files] == [corrupt]
+
+        # Files that were skipped before are not opened again
+        probe = NAIP._probe
+        probed = []
+
+        def record(self: NAIP, filepath: str, crs: CRS) -> Any:
+            probed.append(filepath)
+            return probe(self, filepath, crs)
+
+        monkeypatch.setattr(NAIP, "_probe", record)  # type: ignore[attr-defined]
+        valid = os.path.join(root, "m_3807511_ne_18_060_20190605.tif")
+        os.utime(valid, (0, 0))
+        ds = NAIP(root)
+        assert probed == [valid]
+        assert [filepath for filepath, _ in ds.skipped_files] == [corrupt]
+
+        # Unless they have been modified since
+        with open(corrupt, "a") as f:
+            f.write("still corrupt")
+        ds = NAIP(root)
+        assert corrupt in probed
+        assert [filepath for filepath, _ in ds.skipped_files] == [corrupt]
+
+    def test_dangling_symlink(self, tmp_path: Path) -> None:
+        root = str(tmp_path / "naip")
+        shutil.copytree(os.path.join("tests", "data", "naip"), root)
+        link = os.path.join(root, "m_9999999_ne_18_060_20181104.tif")
+        os.symlink(os.path.join(root, "missing.tif"), link)
+        ds = NAIP(root)
+        assert len(ds) == 2
+        assert [filepath for filepath, _ in ds.skipped_files] == [link]
+
+        # Rebuilding with the dangling symlink in the cached skipped files
+        os.utime(os.path.join(root, "m_3807511_ne_18_060_20190605.tif"), (0, 0))
+        ds = NAIP(root)
+        assert len(ds) == 2
+        assert [filepath for filepath, _ in ds.skipped_files] == [link]
+
 
 class TestVectorDataset:
     @pytest.fixture
@@ -9,6 +9,7 @@ import pickle
 import re
 import shutil
 import sys
+import zipfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Tuple
@@ -22,6 +23,7 @@ from rasterio.crs import CRS
 import torchgeo.datasets.utils
 from torchgeo.datasets.utils import (
     BoundingBox,
+    check_integrity,
     concat_samples,
     disambiguate_timestamp,
     download_and_extract_archive,
@@ -100,6 +102,34 @@ def test_extract_archive(src: str, tmp_path: Path) -> None:
     extract_archive(os.path.join("tests", "data", src), str(tmp_path))
 
 
+def test_extract_zip(tmp_path: Path) -> None:
+    src = os.path.join("tests", "data", "landcoverai", "landcover.ai.v1.zip")
+    extract_archive(src, str(tmp_path / "parallel"))
+    with zipfile.ZipFile(src) as f:
+        f.extractall(tmp_path / "serial")
+    for root, dirs, files in os.walk(tmp_path / "serial"):
+        relpath = os.path.relpath(root, tmp_path / "serial")
+        for filename in files:
+            with open(os.path.join(root, filename), "rb") as expected, open(
+                os.path.join(tmp_path, "parallel", relpath, filename), "rb"
+            ) as actual:
+                assert expected.read() == actual.read()
+
+
+def test_extract_zip_in_cwd(
+    monkeypatch: Generator[MonkeyPatch, None, None], tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)  # type: ignore[attr-defined]
+    with zipfile.ZipFile("archive.zip", "w") as f:
+        f.writestr("file.txt", "root")
+        f.writestr("dir/file.txt", "nested")
+    extract_archive("archive.zip")
+    with open(tmp_path / "file.txt") as f:
+        assert f.read() == "root"
+    with open(tmp_path / "dir" / "file.txt") as f:
+        assert f.read() == "nested"
+
+
 def test_missing_rarfile(mock_missing_module: None) -> None:
     with pytest.raises(
         ImportError,
@@ -110,6 +140,15 @@ def test_missing_rarfile(mock_missing_module: None) -> None:
         )
 
 
+def test_check_integrity(tmp_path: Path) -> None:
+    fpath = tmp_path / "file.txt"
+    assert not check_integrity(str(fpath))
+    fpath.write_text("torchgeo")
+    assert check_integrity(str(fpath))
+    assert check_integrity(str(fpath), "2023636afad637b76da804abcc55cf75")
+    assert not check_integrity(str(fpath), "d41d8cd98f00b204e9800998ecf8427e")
+
+
 def test_unsupported_scheme() -> None:
     with pytest.raises(
         RuntimeError, match="src file has unknown archival/compression scheme"
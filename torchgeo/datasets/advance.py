@@ -7,9 +7,9 @@ import glob
 import os
 from typing import Callable, Dict, List, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -236,7 +236,7 @@ class ADVANCE(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -249,6 +249,8 @@ class ADVANCE(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image = np.rollaxis(sample["image"].numpy(), 0, 3)
         label = cast(int, sample["label"].item())
         label_class = self.classes[label]
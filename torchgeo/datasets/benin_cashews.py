@@ -8,11 +8,11 @@ import os
 from functools import lru_cache
 from typing import Callable, Dict, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
 import rasterio.features
 import torch
+from matplotlib.figure import Figure
 from torch import Tensor
 
 from .geo import VisionDataset
@@ -419,7 +419,7 @@ class BeninSmallHolderCashews(VisionDataset):
         show_titles: bool = True,
         time_step: int = 0,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -436,6 +436,8 @@ class BeninSmallHolderCashews(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         rgb_indices = []
         for band in self.RGB_BANDS:
             if band in self.bands:
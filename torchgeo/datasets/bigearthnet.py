@@ -8,10 +8,10 @@ import json
 import os
 from typing import Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
 import torch
+from matplotlib.figure import Figure
 from rasterio.enums import Resampling
 from torch import Tensor
 
@@ -532,7 +532,7 @@ class BigEarthNet(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -548,6 +548,8 @@ class BigEarthNet(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         if self.bands == "s2":
             image = np.rollaxis(sample["image"][[3, 2, 1]].numpy(), 0, 3)
             image = np.clip(image / 2000, 0, 1)
@@ -8,9 +8,9 @@ import csv
 import os
 from typing import Callable, Dict, List, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -196,7 +196,7 @@ class COWC(VisionDataset, abc.ABC):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -209,6 +209,8 @@ class COWC(VisionDataset, abc.ABC):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image = sample["image"]
         label = cast(str, sample["label"].item())
 
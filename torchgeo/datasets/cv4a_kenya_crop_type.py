@@ -8,9 +8,9 @@ import os
 from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -410,7 +410,7 @@ class CV4AKenyaCropType(VisionDataset):
         show_titles: bool = True,
         time_step: int = 0,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -424,6 +424,8 @@ class CV4AKenyaCropType(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         rgb_indices = []
         for band in self.RGB_BANDS:
             if band in self.bands:
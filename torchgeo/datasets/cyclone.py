@@ -8,9 +8,9 @@ import os
 from functools import lru_cache
 from typing import Any, Callable, Dict, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -213,7 +213,7 @@ class TropicalCycloneWindEstimation(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -226,6 +226,8 @@ class TropicalCycloneWindEstimation(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image, label = sample["image"], sample["label"]
 
         showing_predictions = "prediction" in sample
@@ -7,9 +7,9 @@ import glob
 import os
 from typing import Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -261,7 +261,7 @@ class ETCI2021(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -272,6 +272,8 @@ class ETCI2021(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.pyplot as plt
+
         vv = np.rollaxis(sample["image"][:3].numpy(), 0, 3)
         vh = np.rollaxis(sample["image"][3:].numpy(), 0, 3)
         water_mask = sample["mask"][0].numpy()
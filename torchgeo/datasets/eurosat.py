@@ -6,8 +6,8 @@
 import os
 from typing import Callable, Dict, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.figure import Figure
 from torch import Tensor
 
 from .geo import VisionClassificationDataset
@@ -189,7 +189,7 @@ class EuroSAT(VisionClassificationDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -202,6 +202,8 @@ class EuroSAT(VisionClassificationDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image = np.rollaxis(sample["image"][[3, 2, 1]].numpy(), 0, 3).copy()
         image = np.clip(image / 3000, 0, 1)
 
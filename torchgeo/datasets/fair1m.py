@@ -3,15 +3,16 @@
 
 """FAIR1M dataset."""
 
+import concurrent.futures
 import glob
 import os
+import stat
 from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 from xml.etree import ElementTree
 
-import matplotlib.patches as patches
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -247,24 +248,60 @@ class FAIR1M(VisionDataset):
         Raises:
             RuntimeError: if checksum fails or the dataset is not found
         """
+        # Each archive extracts to the directory at the same position. Stat every
+        # directory once and keep the result in the table for the checks below.
+        items: List[Tuple[Optional[os.stat_result], str, str]] = []
+        for directory, filename, md5 in zip(
+            [self.image_root, self.labels_root], self.filenames, self.md5s
+        ):
+            try:
+                dirstat: Optional[os.stat_result] = os.stat(
+                    os.path.join(self.root, directory)
+                )
+            except OSError:
+                dirstat = None
+            items.append((dirstat, filename, md5))
+
         # Check if the files already exist
-        exists = []
-        for directory in [self.image_root, self.labels_root]:
-            exists.append(os.path.exists(os.path.join(self.root, directory)))
-        if all(exists):
+        if all(
+            dirstat is not None and stat.S_ISDIR(dirstat.st_mode)
+            for dirstat, _, _ in items
+        ):
             return
 
-        # Check if .zip files already exists (if so extract)
+        # Check if .zip files already exists (if so extract), a single stat tells
+        # us both whether the path exists and whether it is a regular file
         exists = []
-        for filename, md5 in zip(self.filenames, self.md5s):
+        pending = []
+        for dirstat, filename, md5 in items:
             filepath = os.path.join(self.root, filename)
-            if os.path.isfile(filepath):
-                if self.checksum and not check_integrity(filepath, md5):
-                    raise RuntimeError("Dataset found, but corrupted.")
-                exists.append(True)
-                extract_archive(filepath)
-            else:
+            try:
+                st = os.stat(filepath)
+            except OSError:
                 exists.append(False)
+                continue
+            isfile = stat.S_ISREG(st.st_mode)
+            exists.append(isfile)
+
+            # An extracted directory newer than its archive already holds its
+            # contents, so there is no need to hash or extract it again
+            if isfile and not (
+                dirstat is not None
+                and stat.S_ISDIR(dirstat.st_mode)
+                and dirstat.st_mtime >= st.st_mtime
+            ):
+                pending.append((filepath, md5))
+
+        if self.checksum and pending:
+            # Hash the archives concurrently, hashlib releases the GIL so this is
+            # bound by disk bandwidth rather than by a single core
+            filepaths, md5s = zip(*pending)
+            with concurrent.futures.ThreadPoolExecutor(len(pending)) as executor:
+                if not all(executor.map(check_integrity, filepaths, md5s)):
+                    raise RuntimeError("Dataset found, but corrupted.")
+
+        for filepath, _ in pending:
+            extract_archive(filepath)
 
         if all(exists):
             return
@@ -279,7 +316,7 @@ class FAIR1M(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -290,6 +327,9 @@ class FAIR1M(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.patches as patches
+        import matplotlib.pyplot as plt
+
         image = sample["image"].permute((1, 2, 0)).numpy()
 
         ncols = 1
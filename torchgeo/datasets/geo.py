@@ -4,16 +4,21 @@
 """Base classes for all :mod:`torchgeo` datasets."""
 
 import abc
+import concurrent.futures
+import fnmatch
 import functools
 import glob
+import hashlib
+import logging
 import os
+import pickle
 import re
 import sys
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
+import tempfile
+from typing import Any, Callable, Dict, List, Match, Optional, Sequence, Tuple, cast
 
 import fiona
 import fiona.transform
-import matplotlib.pyplot as plt
 import numpy as np
 import pyproj
 import rasterio
@@ -30,6 +35,7 @@ from torch.utils.data import Dataset
 from torchvision.datasets import ImageFolder
 from torchvision.datasets.folder import default_loader as pil_loader
 
+from .. import __version__
 from .utils import BoundingBox, concat_samples, disambiguate_timestamp, merge_samples
 
 # https://github.com/pytorch/pytorch/issues/60979
@@ -37,6 +43,79 @@ from .utils import BoundingBox, concat_samples, disambiguate_timestamp, merge_sa
 Dataset.__module__ = "torch.utils.data"
 ImageFolder.__module__ = "torchvision.datasets"
 
+logger = logging.getLogger(__name__)
+
+# Bump whenever the contents of the index cache, or how they are computed, change
+_INDEX_CACHE_VERSION = 2
+
+
+def _transform_bounds(
+    transformer: pyproj.Transformer,
+    minx: float,
+    miny: float,
+    maxx: float,
+    maxy: float,
+    densify_pts: int = 21,
+) -> Tuple[float, float, float, float]:
+    """Reproject a bounding box.
+
+    Points along each edge are reprojected too, since straight edges may be curved
+    in the destination CRS.
+
+    Args:
+        transformer: transformation from the source to the destination CRS
+        minx: western boundary
+        miny: southern boundary
+        maxx: eastern boundary
+        maxy: northern boundary
+        densify_pts: number of points to reproject along each edge
+
+    Returns:
+        (minx, miny, maxx, maxy) in the destination CRS
+    """
+    xs = np.linspace(minx, maxx, densify_pts)
+    ys = np.linspace(miny, maxy, densify_pts)
+    x = np.concatenate([xs, xs, np.full_like(ys, minx), np.full_like(ys, maxx)])
+    y = np.concatenate([np.full_like(xs, miny), np.full_like(xs, maxy), ys, ys])
+    x, y = transformer.transform(x, y)
+    return float(np.min(x)), float(np.min(y)), float(np.max(x)), float(np.max(y))
+
+
+def _is_georeferenced(src: DatasetReader) -> bool:
+    """Check whether a raster file can be placed on a map.
+
+    Args:
+        src: raster file
+
+    Returns:
+        True if the file has a CRS, GCPs, or RPCs, else False
+    """
+    # RPCs are only exposed by rasterio 1.2+
+    return src.crs is not None or bool(src.gcps[0]) or bool(getattr(src, "rpcs", None))
+
+
+def _is_north_up(src: DatasetReader) -> bool:
+    """Check whether the bounds of a raster file can be used without warping it.
+
+    Args:
+        src: raster file
+
+    Returns:
+        True if the file has a CRS and a north-up geotransform and is not
+        georeferenced by GCPs or RPCs, else False
+    """
+    transform = src.transform
+    return (
+        src.crs is not None
+        and not src.gcps[0]
+        # RPCs are only exposed by rasterio 1.2+
+        and not getattr(src, "rpcs", None)
+        and transform.b == 0
+        and transform.d == 0
+        and transform.a > 0
+        and transform.e < 0
+    )
+
 
 class GeoDataset(Dataset[Dict[str, Any]], abc.ABC):
     """Abstract base class for datasets containing geospatial information.
@@ -208,8 +287,7 @@ class GeoDataset(Dataset[Dict[str, Any]], abc.ABC):
         """
         attrs, tuples = state
         self.__dict__.update(attrs)
-        for item in tuples:
-            self.index.insert(*item)
+        self.index = Index(tuples, interleaved=False, properties=Property(dimension=3))
 
     @property
     def bounds(self) -> BoundingBox:
@@ -245,21 +323,20 @@ class GeoDataset(Dataset[Dict[str, Any]], abc.ABC):
         if new_crs == self._crs:
             return
 
-        new_index = Index(interleaved=False, properties=Property(dimension=3))
-
         project = pyproj.Transformer.from_crs(
             pyproj.CRS(str(self._crs)), pyproj.CRS(str(new_crs)), always_xy=True
         ).transform
+        entries = []
         for hit in self.index.intersection(self.index.bounds, objects=True):
             old_minx, old_maxx, old_miny, old_maxy, mint, maxt = hit.bounds
             old_box = shapely.geometry.box(old_minx, old_miny, old_maxx, old_maxy)
             new_box = shapely.ops.transform(project, old_box)
             new_minx, new_miny, new_maxx, new_maxy = new_box.bounds
             new_bounds = (new_minx, new_maxx, new_miny, new_maxy, mint, maxt)
-            new_index.insert(hit.id, new_bounds, hit.object)
+            entries.append((hit.id, new_bounds, hit.object))
 
         self._crs = new_crs
-        self.index = new_index
+        self.index = Index(entries, interleaved=False, properties=Property(dimension=3))
 
 
 class RasterDataset(GeoDataset):
@@ -320,6 +397,12 @@ class RasterDataset(GeoDataset):
     ) -> None:
         """Initialize a new Dataset instance.
 
+        The index of the files in ``root`` is cached in
+        ``$XDG_CACHE_HOME/torchgeo/index`` (``~/.cache/torchgeo/index`` by default) and
+        reused by later instances until a matching file is added, removed, or
+        modified. Set the ``TORCHGEO_INDEX_CACHE`` environment variable to ``0`` to
+        disable this cache.
+
         Args:
             root: root directory where dataset can be found
             crs: :term:`coordinate reference system (CRS)` to warp to
@@ -329,6 +412,7 @@ class RasterDataset(GeoDataset):
             transforms: a function/transform that takes an input sample
                 and returns a transformed version
             cache: if True, cache file handle to speed up repeated sampling
+                (unrelated to the index cache)
 
         Raises:
             FileNotFoundError: if no files are found in ``root``
@@ -337,47 +421,47 @@ class RasterDataset(GeoDataset):
 
         self.root = root
         self.cache = cache
+        self._filename_regex = re.compile(self.filename_regex, re.VERBOSE)
+
+        # Reuse the index built by a previous instance if no matching file changed
+        found = self._find_files(root)
+        files = {filepath: fingerprint for filepath, _, fingerprint in found}
+        use_index_cache = os.environ.get("TORCHGEO_INDEX_CACHE", "1") != "0"
+        cache_path = self._index_cache_path(root, crs, res)
+        state = self._load_index_cache(cache_path) if use_index_cache else None
+        if state is None or state["files"] != files:
+            # Files that could not be read last time are not probed again unless
+            # they have been modified since
+            skipped = None if state is None else state["skipped"]
+            state = self._build_index(found, crs, res, skipped)
+            if use_index_cache and state["entries"]:
+                self._save_index_cache(cache_path, state)
+
+        crs = state["crs"]
+        res = state["res"]
+        if state["cmap"] is not None:
+            self.cmap = state["cmap"]
+
+        if not state["entries"]:
+            raise FileNotFoundError(
+                f"No {self.__class__.__name__} data was found in '{root}'"
+            )
 
         # Populate the dataset index
-        i = 0
-        pathname = os.path.join(root, "**", self.filename_glob)
-        filename_regex = re.compile(self.filename_regex, re.VERBOSE)
-        for filepath in glob.iglob(pathname, recursive=True):
-            match = re.match(filename_regex, os.path.basename(filepath))
-            if match is not None:
-                try:
-                    with rasterio.open(filepath) as src:
-                        # See if file has a color map
-                        try:
-                            self.cmap = src.colormap(1)
-                        except ValueError:
-                            pass
-
-                        if crs is None:
-                            crs = src.crs
-                        if res is None:
-                            res = src.res[0]
-
-                        with WarpedVRT(src, crs=crs) as vrt:
-                            minx, miny, maxx, maxy = vrt.bounds
-                except rasterio.errors.RasterioIOError:
-                    # Skip files that rasterio is unable to read
-                    continue
-                else:
-                    mint: float = 0
-                    maxt: float = sys.maxsize
-                    if "date" in match.groupdict():
-                        date = match.group("date")
-                        mint, maxt = disambiguate_timestamp(date, self.date_format)
+        # Passing all entries at once uses libspatialindex's bulk loader, which is
+        # much faster than inserting them one at a time
+        self.index = Index(
+            state["entries"], interleaved=False, properties=Property(dimension=3)
+        )
 
-                    coords = (minx, maxx, miny, maxy, mint, maxt)
-                    self.index.insert(i, coords, filepath)
-                    i += 1
+        # Look up filepaths by index id in __getitem__, which is much cheaper than
+        # having rtree unpickle the object stored with every hit
+        self._filepaths = [filepath for _, _, filepath in state["entries"]]
 
-        if i == 0:
-            raise FileNotFoundError(
-                f"No {self.__class__.__name__} data was found in '{root}'"
-            )
+        #: (filepath, error) pairs of files that matched but could not be read
+        self.skipped_files: List[Tuple[str, str]] = [
+            (filepath, error) for filepath, (error, _, _) in state["skipped"].items()
+        ]
 
         self._crs = cast(CRS, crs)
         self.res = cast(float, res)
@@ -394,8 +478,8 @@ class RasterDataset(GeoDataset):
         Raises:
             IndexError: if query is not found in the index
         """
-        hits = self.index.intersection(tuple(query), objects=True)
-        filepaths = [hit.object for hit in hits]
+        hits = self.index.intersection(tuple(query))
+        filepaths = [self._filepaths[hit] for hit in hits]
 
         if not filepaths:
             raise IndexError(
@@ -404,23 +488,29 @@ class RasterDataset(GeoDataset):
 
         if self.separate_files:
             data_list: List[Tensor] = []
-            filename_regex = re.compile(self.filename_regex, re.VERBOSE)
+
+            # Split and match each filepath once, not once per band
+            parsed = []
+            for filepath in filepaths:
+                directory, filename = os.path.split(filepath)
+                match = self._filename_regex.match(filename)
+                groups = match.groupdict() if match else {}
+                parsed.append((directory, filename, match, groups))
+
             for band in getattr(self, "bands", self.all_bands):
                 band_filepaths = []
-                for filepath in filepaths:
-                    filename = os.path.basename(filepath)
-                    directory = os.path.dirname(filepath)
-                    match = re.match(filename_regex, filename)
+                for directory, filename, match, groups in parsed:
                     if match:
-                        if "date" in match.groupdict():
+                        if "date" in groups:
                             start = match.start("band")
                             end = match.end("band")
                             filename = filename[:start] + band + filename[end:]
-                        if "resolution" in match.groupdict():
+                        if "resolution" in groups:
                             start = match.start("resolution")
                             end = match.end("resolution")
                             filename = filename[:start] + "*" + filename[end:]
-                    filepath = glob.glob(os.path.join(directory, filename))[0]
+                    filename = fnmatch.filter(self._list_dir(directory), filename)[0]
+                    filepath = os.path.join(directory, filename)
                     band_filepaths.append(filepath)
                 data_list.append(self._merge_files(band_filepaths, query))
             data = torch.cat(data_list)  # type: ignore[attr-defined]
@@ -435,6 +525,288 @@ class RasterDataset(GeoDataset):
 
         return sample
 
+    def _find_files(
+        self, root: str
+    ) -> List[Tuple[str, Match[str], Tuple[Optional[int], Optional[int]]]]:
+        """Find all files matching the glob expression and regular expression.
+
+        Args:
+            root: root directory where dataset can be found
+
+        Returns:
+            the path, filename match, and modification time and size of each file in
+            glob order (None if the file could not be stat'ed, e.g. a dangling
+            symlink)
+        """
+        pathname = os.path.join(root, "**", self.filename_glob)
+        found = []
+        for filepath in glob.iglob(pathname, recursive=True):
+            match = self._filename_regex.match(os.path.basename(filepath))
+            if match is None:
+                continue
+
+            fingerprint: Tuple[Optional[int], Optional[int]]
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                fingerprint = (None, None)
+            else:
+                fingerprint = (st.st_mtime_ns, st.st_size)
+            found.append((filepath, match, fingerprint))
+
+        return found
+
+    def _build_index(
+        self,
+        found: List[Tuple[str, Match[str], Tuple[Optional[int], Optional[int]]]],
+        crs: Optional[CRS],
+        res: Optional[float],
+        skipped: Optional[Dict[str, Tuple[str, Optional[int], Optional[int]]]] = None,
+    ) -> Dict[str, Any]:
+        """Build the contents of the dataset index.
+
+        Args:
+            found: files to index, returned by :meth:`_find_files`
+            crs: :term:`coordinate reference system (CRS)` to warp to
+                (defaults to the CRS of the first file found)
+            res: resolution of the dataset in units of CRS
+                (defaults to the resolution of the first file found)
+            skipped: files skipped by a previous build, mapped to the error and the
+                modification time and size of the file when it was skipped (None if
+                the file could not be stat'ed)
+
+        Returns:
+            the indexed files, CRS, resolution, color map, index entries, and skipped
+            files of the dataset
+        """
+        files = {filepath: fingerprint for filepath, _, fingerprint in found}
+        matches = []
+        known_bad: Dict[str, Tuple[str, Optional[int], Optional[int]]] = {}
+        for filepath, match, (mtime, size) in found:
+            # Don't open files again that failed to open and haven't changed since.
+            # Files that could not be stat'ed have no fingerprint and are probed again.
+            if skipped is not None and filepath in skipped:
+                if mtime is not None and skipped[filepath][1:] == (mtime, size):
+                    known_bad[filepath] = skipped[filepath]
+                    continue
+
+            matches.append((filepath, match))
+
+        # Default to the CRS and resolution of the first readable file
+        if crs is None or res is None:
+            for filepath, _ in matches:
+                try:
+                    with rasterio.open(filepath) as src:
+                        if not _is_georeferenced(src):
+                            continue
+                        if src.crs is None:
+                            # e.g. georeferenced by GCPs, let GDAL work out the grid
+                            with WarpedVRT(src) as vrt:
+                                src_crs, src_res = vrt.crs, vrt.res[0]
+                        else:
+                            src_crs, src_res = src.crs, src.res[0]
+                        if crs is None:
+                            crs = src_crs
+                        if res is None:
+                            res = src_res
+                except (rasterio.errors.RasterioIOError, ValueError):
+                    continue
+                else:
+                    break
+
+        # Reading file metadata is I/O bound and GDAL releases the GIL, so files are
+        # probed in parallel. Results are collected in glob order so that index ids
+        # do not depend on thread scheduling.
+        entries: List[
+            Tuple[int, Tuple[float, float, float, float, float, float], str]
+        ] = []
+        file_cmap = None
+
+        # Setting up a PROJ transformation dominates the cost of reprojecting bounds,
+        # so only create one per source CRS rather than one per file
+        transformers: Dict[str, Optional[pyproj.Transformer]] = {}
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(self._probe, filepath, crs) for filepath, _ in matches
+            ]
+            for (filepath, match), future in zip(matches, futures):
+                try:
+                    (minx, miny, maxx, maxy), src_crs, cmap = future.result()
+
+                    # Only reproject if necessary
+                    key = str(src_crs)
+                    if key not in transformers:
+                        transformer = None
+                        if src_crs != crs:
+                            transformer = pyproj.Transformer.from_crs(
+                                pyproj.CRS(key), pyproj.CRS(str(crs)), always_xy=True
+                            )
+                        transformers[key] = transformer
+                    transformer = transformers[key]
+                    if transformer is not None:
+                        minx, miny, maxx, maxy = _transform_bounds(
+                            transformer, minx, miny, maxx, maxy
+                        )
+                except (
+                    rasterio.errors.RasterioIOError,
+                    ValueError,
+                    pyproj.exceptions.ProjError,
+                ) as e:
+                    # Skip files that can't be read or placed in the target CRS
+                    logger.debug("Skipping %s: %s", filepath, e)
+                    mtime, size = files[filepath]
+                    known_bad[filepath] = (repr(e), mtime, size)
+                    continue
+
+                if cmap is not None:
+                    file_cmap = cmap
+
+                mint: float = 0
+                maxt: float = sys.maxsize
+                if "date" in match.groupdict():
+                    date = match.group("date")
+                    mint, maxt = disambiguate_timestamp(date, self.date_format)
+
+                coords = (minx, maxx, miny, maxy, mint, maxt)
+                entries.append((len(entries), coords, filepath))
+
+        return {
+            "files": files,
+            "crs": crs,
+            "res": res,
+            "cmap": file_cmap,
+            "entries": entries,
+            "skipped": known_bad,
+        }
+
+    def _index_cache_path(
+        self, root: str, crs: Optional[CRS], res: Optional[float]
+    ) -> str:
+        """Path to the on-disk cache of the dataset index.
+
+        Args:
+            root: root directory where dataset can be found
+            crs: :term:`coordinate reference system (CRS)` to warp to
+            res: resolution of the dataset in units of CRS
+
+        Returns:
+            path of the cache file for this combination of arguments
+        """
+        key = (
+            __version__,
+            _INDEX_CACHE_VERSION,
+            os.path.abspath(root),
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            self.filename_glob,
+            self.filename_regex,
+            self.date_format,
+            None if crs is None else crs.to_wkt(),
+            res,
+        )
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        cache_home = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+        return os.path.join(cache_home, "torchgeo", "index", f"{digest}.pkl")
+
+    def _load_index_cache(self, path: str) -> Optional[Dict[str, Any]]:
+        """Load a cached dataset index.
+
+        Args:
+            path: path of the cache file
+
+        Returns:
+            the cached index, or None if it is missing
+        """
+        try:
+            with open(path, "rb") as f:
+                state: Dict[str, Any] = pickle.load(f)
+        except Exception:
+            # Missing, corrupt, or written by an incompatible version
+            return None
+
+        if "files" not in state or "skipped" not in state:
+            return None
+
+        return state
+
+    def _save_index_cache(self, path: str, state: Dict[str, Any]) -> None:
+        """Save the dataset index so that future instances can skip building it.
+
+        Args:
+            path: path of the cache file
+            state: the index to cache
+        """
+        directory = os.path.dirname(path)
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as f:
+                tmp_path = f.name
+                pickle.dump(state, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Caching is best effort, e.g. the cache directory may be read-only or
+            # full, but don't leave partially written files behind
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _probe(
+        self, filepath: str, crs: Optional[CRS]
+    ) -> Tuple[
+        Tuple[float, float, float, float],
+        CRS,
+        Optional[Dict[int, Tuple[int, int, int, int]]],
+    ]:
+        """Read the bounds, CRS, and color map of a file.
+
+        Args:
+            filepath: file to read
+            crs: :term:`coordinate reference system (CRS)` to warp files to that
+                can't be indexed by their own bounds
+
+        Returns:
+            (minx, miny, maxx, maxy) bounds, the CRS of the bounds, and the color map
+            (if any) of the file
+
+        Raises:
+            RasterioIOError: if rasterio is unable to read the file
+            CRSError: if the file is not georeferenced
+        """
+        # By default GDAL lists the directory of every file it opens to find
+        # sidecar files, which is quadratic in the number of files per directory.
+        # Disabling this makes GDAL stat only the sidecar files it looks for. Respect
+        # the option if the user already set it, e.g. to EMPTY_DIR.
+        options = {}
+        if rasterio.env.get_gdal_config("GDAL_DISABLE_READDIR_ON_OPEN") is None:
+            options["GDAL_DISABLE_READDIR_ON_OPEN"] = True
+        env = rasterio.Env(**options)
+        with env, rasterio.open(filepath) as src:
+            # See if file has a color map
+            try:
+                cmap = src.colormap(1)
+            except ValueError:
+                cmap = None
+
+            if not _is_georeferenced(src):
+                raise rasterio.errors.CRSError(f"{filepath} is not georeferenced")
+
+            if _is_north_up(src):
+                minx, miny, maxx, maxy = src.bounds
+                return (minx, miny, maxx, maxy), src.crs, cmap
+
+            # Rotated, south-up, and GCP or RPC georeferenced files need GDAL to
+            # work out their footprint
+            with WarpedVRT(src, crs=crs) as vrt:
+                minx, miny, maxx, maxy = vrt.bounds
+                return (minx, miny, maxx, maxy), vrt.crs, cmap
+
     def _merge_files(self, filepaths: Sequence[str], query: BoundingBox) -> Tensor:
         """Load and merge one or more files.
 
@@ -466,6 +838,22 @@ class RasterDataset(GeoDataset):
         tensor: Tensor = torch.tensor(dest)  # type: ignore[attr-defined]
         return tensor
 
+    @functools.lru_cache(maxsize=128)
+    def _list_dir(self, directory: str) -> List[str]:
+        """List the contents of a directory.
+
+        Listings are cached so that finding the file for each band does not require
+        a directory scan per band, per file, per sample.
+
+        Args:
+            directory: directory to list
+
+        Returns:
+            names of the entries in the directory
+        """
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it]
+
     @functools.lru_cache(maxsize=128)
     def _cached_load_warp_file(self, filepath: str) -> DatasetReader:
         """Cached version of :meth:`_load_warp_file`.
@@ -507,6 +895,8 @@ class RasterDataset(GeoDataset):
             AssertionError: if ``is_image`` is True and ``data`` has a different number
                 of channels than expected
         """
+        import matplotlib.pyplot as plt
+
         array = data.squeeze().numpy()
 
         if self.is_image:
@@ -577,7 +967,7 @@ class VectorDataset(GeoDataset):
         self.res = res
 
         # Populate the dataset index
-        i = 0
+        entries = []
         pathname = os.path.join(root, "**", self.filename_glob)
         for filepath in glob.iglob(pathname, recursive=True):
             try:
@@ -596,14 +986,14 @@ class VectorDataset(GeoDataset):
                 mint = 0
                 maxt = sys.maxsize
                 coords = (minx, maxx, miny, maxy, mint, maxt)
-                self.index.insert(i, coords, filepath)
-                i += 1
+                entries.append((len(entries), coords, filepath))
 
-        if i == 0:
+        if not entries:
             raise FileNotFoundError(
                 f"No {self.__class__.__name__} data was found in '{root}'"
             )
 
+        self.index = Index(entries, interleaved=False, properties=Property(dimension=3))
         self._crs = crs
 
     def __getitem__(self, query: BoundingBox) -> Dict[str, Any]:
@@ -672,6 +1062,8 @@ class VectorDataset(GeoDataset):
         Args:
             data: the data to plot
         """
+        import matplotlib.pyplot as plt
+
         array = data.squeeze().numpy()
 
         # Plot the image
@@ -870,14 +1262,15 @@ class IntersectionDataset(GeoDataset):
 
     def _merge_dataset_indices(self) -> None:
         """Create a new R-tree out of the individual indices from two datasets."""
-        i = 0
+        entries = []
         ds1, ds2 = self.datasets
         for hit1 in ds1.index.intersection(ds1.index.bounds, objects=True):
             for hit2 in ds2.index.intersection(hit1.bounds, objects=True):
                 box1 = BoundingBox(*hit1.bounds)
                 box2 = BoundingBox(*hit2.bounds)
-                self.index.insert(i, tuple(box1 & box2))
-                i += 1
+                entries.append((len(entries), tuple(box1 & box2), None))
+
+        self.index = Index(entries, interleaved=False, properties=Property(dimension=3))
 
     def __getitem__(self, query: BoundingBox) -> Dict[str, Any]:
         """Retrieve image and metadata indexed by query.
@@ -982,12 +1375,13 @@ class UnionDataset(GeoDataset):
 
     def _merge_dataset_indices(self) -> None:
         """Create a new R-tree out of the individual indices from two datasets."""
-        i = 0
+        entries = []
         for ds in self.datasets:
             hits = ds.index.intersection(ds.index.bounds, objects=True)
             for hit in hits:
-                self.index.insert(i, hit.bounds)
-                i += 1
+                entries.append((len(entries), hit.bounds, None))
+
+        self.index = Index(entries, interleaved=False, properties=Property(dimension=3))
 
     def __getitem__(self, query: BoundingBox) -> Dict[str, Any]:
         """Retrieve image and metadata indexed by query.
@@ -7,9 +7,9 @@ import glob
 import os
 from typing import Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -241,9 +241,7 @@ class GID15(VisionDataset):
             md5=self.md5 if self.checksum else None,
         )
 
-    def plot(
-        self, sample: Dict[str, Tensor], suptitle: Optional[str] = None
-    ) -> plt.Figure:
+    def plot(self, sample: Dict[str, Tensor], suptitle: Optional[str] = None) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -255,6 +253,8 @@ class GID15(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         if self.split != "test":
             image, mask = sample["image"], sample["mask"]
             ncols = 2
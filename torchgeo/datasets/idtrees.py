@@ -8,10 +8,10 @@ import os
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import fiona
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
 import torch
+from matplotlib.figure import Figure
 from rasterio.enums import Resampling
 from torch import Tensor
 from torchvision.utils import draw_bounding_boxes
@@ -434,7 +434,7 @@ class IDTReeS(VisionDataset):
         show_titles: bool = True,
         suptitle: Optional[str] = None,
         hsi_indices: Tuple[int, int, int] = (0, 1, 2),
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -446,6 +446,8 @@ class IDTReeS(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.pyplot as plt
+
         assert len(hsi_indices) == 3
 
         def normalize(x: Tensor) -> Tensor:
@@ -518,6 +520,8 @@ class IDTReeS(VisionDataset):
         Raises:
             ImportError: if open3d is not installed
         """
+        import matplotlib.pyplot as plt
+
         try:
             import open3d  # noqa: F401
         except ImportError:
@@ -8,10 +8,10 @@ import os
 from functools import lru_cache
 from typing import Callable, Dict, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
 from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -218,7 +218,7 @@ class LandCoverAI(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -231,6 +231,8 @@ class LandCoverAI(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image = np.rollaxis(sample["image"].numpy(), 0, 3)
         mask = sample["mask"].numpy()
 
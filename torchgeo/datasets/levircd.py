@@ -7,9 +7,9 @@ import glob
 import os
 from typing import Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -213,7 +213,7 @@ class LEVIRCDPlus(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -226,6 +226,8 @@ class LEVIRCDPlus(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image1, image2, mask = (sample["image"][0], sample["image"][1], sample["mask"])
         ncols = 3
 
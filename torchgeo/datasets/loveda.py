@@ -7,9 +7,9 @@ import glob
 import os
 from typing import Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -265,9 +265,7 @@ class LoveDA(VisionDataset):
             md5=self.md5 if self.checksum else None,
         )
 
-    def plot(
-        self, sample: Dict[str, Tensor], suptitle: Optional[str] = None
-    ) -> plt.Figure:
+    def plot(self, sample: Dict[str, Tensor], suptitle: Optional[str] = None) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -277,6 +275,8 @@ class LoveDA(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.pyplot as plt
+
         if self.split != "test":
             image, mask = sample["image"], sample["mask"]
             ncols = 2
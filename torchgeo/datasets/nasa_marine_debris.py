@@ -6,10 +6,10 @@
 import os
 from typing import Callable, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
 import torch
+from matplotlib.figure import Figure
 from torch import Tensor
 from torchvision.utils import draw_bounding_boxes
 
@@ -214,7 +214,7 @@ class NASAMarineDebris(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -225,6 +225,8 @@ class NASAMarineDebris(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.pyplot as plt
+
         ncols = 1
 
         image = draw_bounding_boxes(image=sample["image"], boxes=sample["boxes"])
@@ -3,11 +3,11 @@
 
 """OSCD dataset."""
 
+import concurrent.futures
 import glob
 import os
 from typing import Callable, Dict, List, Optional, Sequence, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
 from matplotlib.figure import Figure
@@ -258,13 +258,21 @@ class OSCD(VisionDataset):
 
     def _download(self) -> None:
         """Download the dataset."""
-        for f_name in self.urls:
-            download_url(
-                self.urls[f_name],
-                self.root,
-                filename=f_name,
-                md5=self.md5s[f_name] if self.checksum else None,
-            )
+        # Download all files concurrently so that the latency of each request
+        # overlaps with the transfer of the others
+        with concurrent.futures.ThreadPoolExecutor(len(self.urls)) as executor:
+            futures = [
+                executor.submit(
+                    download_url,
+                    self.urls[f_name],
+                    self.root,
+                    filename=f_name,
+                    md5=self.md5s[f_name] if self.checksum else None,
+                )
+                for f_name in self.urls
+            ]
+            for future in futures:
+                future.result()
 
     def _extract(self) -> None:
         """Extract the dataset."""
@@ -290,6 +298,8 @@ class OSCD(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.pyplot as plt
+
         ncols = 2
 
         rgb_inds = [3, 2, 1] if self.bands == "all" else [0, 1, 2]
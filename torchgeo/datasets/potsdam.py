@@ -6,7 +6,6 @@
 import os
 from typing import Callable, Dict, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
 import torch
@@ -257,6 +256,8 @@ class Potsdam2D(VisionDataset):
         Returns:
             a matplotlib Figure with the rendered sample
         """
+        import matplotlib.pyplot as plt
+
         ncols = 1
         image1 = draw_semantic_segmentation_masks(
             sample["image"][:3],
@@ -6,8 +6,8 @@
 import os
 from typing import Callable, Dict, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.figure import Figure
 from torch import Tensor
 
 from .geo import VisionClassificationDataset
@@ -246,7 +246,7 @@ class RESISC45(VisionClassificationDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -259,6 +259,8 @@ class RESISC45(VisionClassificationDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image = np.rollaxis(sample["image"].numpy(), 0, 3)
         label = cast(int, sample["label"].item())
         label_class = self.classes[label]
@@ -7,10 +7,10 @@ import os
 from collections import defaultdict
 from typing import Callable, Dict, List, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio
 import torch
+from matplotlib.figure import Figure
 from PIL import Image
 from torch import Tensor
 
@@ -236,7 +236,7 @@ class SeasonalContrastS2(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -253,6 +253,8 @@ class SeasonalContrastS2(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         if "prediction" in sample:
             raise ValueError("This dataset doesn't support plotting predictions")
 
@@ -6,9 +6,9 @@
 import os
 from typing import Callable, Dict, Optional, cast
 
-import matplotlib.pyplot as plt
 import numpy as np
 import torch
+from matplotlib.figure import Figure
 from torch import Tensor
 
 from .geo import VisionDataset
@@ -208,7 +208,7 @@ class So2Sat(VisionDataset):
         sample: Dict[str, Tensor],
         show_titles: bool = True,
         suptitle: Optional[str] = None,
-    ) -> plt.Figure:
+    ) -> Figure:
         """Plot a sample from the dataset.
 
         Args:
@@ -221,6 +221,8 @@ class So2Sat(VisionDataset):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         image = np.rollaxis(sample["image"][[10, 9, 8]].numpy(), 0, 3)
         image = percentile_normalization(image, 0, 100)
         label = cast(int, sample["label"].item())
@@ -12,7 +12,6 @@ import re
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import fiona
-import matplotlib.pyplot as plt
 import numpy as np
 import rasterio as rio
 import torch
@@ -311,6 +310,8 @@ class SpaceNet(VisionDataset, abc.ABC):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         # image can be 1 channel or >3 channels
         if sample["image"].shape[0] == 1:
             image = np.rollaxis(sample["image"].numpy(), 0, 3)
@@ -958,6 +959,8 @@ class SpaceNet5(SpaceNet):
 
         .. versionadded:: 0.2
         """
+        import matplotlib.pyplot as plt
+
         # image can be 1 channel or >3 channels
         if sample["image"].shape[0] == 1:
             image = np.rollaxis(sample["image"].numpy(), 0, 3)
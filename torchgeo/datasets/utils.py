@@ -5,8 +5,10 @@
 
 import bz2
 import collections
+import concurrent.futures
 import contextlib
 import gzip
+import hashlib
 import lzma
 import os
 import sys
@@ -32,7 +34,7 @@ import numpy as np
 import rasterio
 import torch
 from torch import Tensor
-from torchvision.datasets.utils import check_integrity, download_url
+from torchvision.datasets.utils import download_url
 from torchvision.utils import draw_segmentation_masks
 
 __all__ = (
@@ -79,6 +81,78 @@ class _rarfile:
             pass
 
 
+def check_integrity(fpath: str, md5: Optional[str] = None) -> bool:
+    """Check the integrity of a file.
+
+    Drop-in replacement for :func:`torchvision.datasets.utils.check_integrity` that
+    hashes large archives faster. On Python 3.11+, :func:`hashlib.file_digest` hands
+    the file to OpenSSL directly, otherwise the file is read in large chunks.
+
+    Args:
+        fpath: file to check
+        md5: expected MD5 checksum of the file (skip checksum if None)
+
+    Returns:
+        True if the file exists and its checksum matches, else False
+
+    .. versionchanged:: 0.2
+       Implemented in TorchGeo instead of re-exported from torchvision.
+    """
+    if not os.path.isfile(fpath):
+        return False
+    if md5 is None:
+        return True
+
+    with open(fpath, "rb") as f:
+        if sys.version_info >= (3, 11):
+            digest = hashlib.file_digest(f, "md5")
+        else:
+            digest = hashlib.md5()
+            chunk_size = 4 * 1024 * 1024
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+
+    return digest.hexdigest() == md5
+
+
+def _extract_zip(src: str, dst: str) -> None:
+    """Extract a zip file, decompressing members in parallel.
+
+    zlib releases the GIL while decompressing, so archives containing many files
+    extract much faster with a thread pool than with
+    :meth:`zipfile.ZipFile.extractall`.
+
+    Args:
+        src: zip file to be extracted
+        dst: directory to extract to
+    """
+    # Like ZipFile.extract, extract relative to the working directory by default
+    dst = dst or os.getcwd()
+
+    with zipfile.ZipFile(src, "r") as f:
+        members = f.infolist()
+
+        # Create all directories up front so that workers don't race to create them
+        for member in members:
+            parts = [p for p in member.filename.split("/") if p not in ("", ".", "..")]
+            if not member.is_dir():
+                parts = parts[:-1]
+            os.makedirs(os.path.join(dst, *parts), exist_ok=True)
+
+        def extract(member: zipfile.ZipInfo) -> None:
+            try:
+                f.extract(member, dst)
+            except FileExistsError:
+                # ZipFile sanitizes some names (e.g. on Windows) differently from the
+                # directories created above, so another worker may have created the
+                # parent directory in between. It exists now, so try again.
+                f.extract(member, dst)
+
+        files = [member for member in members if not member.is_dir()]
+        with concurrent.futures.ThreadPoolExecutor(os.cpu_count()) as executor:
+            list(executor.map(extract, files))
+
+
 def extract_archive(src: str, dst: Optional[str] = None) -> None:
     """Extract an archive.
 
@@ -98,9 +172,12 @@ def extract_archive(src: str, dst: Optional[str] = None) -> None:
             (".tar", ".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tbz2", ".tbz", ".txz"),
             tarfile.open,
         ),
-        (".zip", zipfile.ZipFile),
     ]
 
+    if src.endswith(".zip"):
+        _extract_zip(src, dst)
+        return
+
     for suffix, extractor in suffix_and_extractor:
         if src.endswith(suffix):
             with extractor(src, "r") as f:
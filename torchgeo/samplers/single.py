@@ -39,11 +39,14 @@ class GeoSampler(Sampler[BoundingBox], abc.ABC):
             self.index = dataset.index
             roi = BoundingBox(*self.index.bounds)
         else:
-            self.index = Index(interleaved=False, properties=Property(dimension=3))
+            entries = []
             hits = dataset.index.intersection(tuple(roi), objects=True)
             for hit in hits:
                 bbox = BoundingBox(*hit.bounds) & roi
-                self.index.insert(hit.id, tuple(bbox), hit.object)
+                entries.append((hit.id, tuple(bbox), hit.object))
+            self.index = Index(
+                entries, interleaved=False, properties=Property(dimension=3)
+            )
 
         self.res = dataset.res
         self.roi = roi